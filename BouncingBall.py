@@ -1,11 +1,17 @@
 import pygame
 import math
+from collections import OrderedDict, deque
 import sys
 import webbrowser  # To open the URL when clicked
 
+from physics import resolve_ball
+
 # Screen settings
 WIDTH, HEIGHT = 800, 600
 FPS = 60
+PAUSED_FPS = 15  # the scene is static while paused, so poll less often
+PHYSICS_DT = 1.0 / FPS  # physics always advances in fixed steps of one logical frame
+MAX_PHYSICS_STEPS = 5   # catch-up limit per rendered frame so a stall cannot snowball
 
 # Hexagon settings
 HEXAGON_CENTER = (WIDTH // 2, HEIGHT // 2)
@@ -15,13 +21,18 @@ hexagon_angular_velocity = 0.01  # initial angular velocity (radians per frame)
 ANGULAR_ACCELERATION = 0.002     # angular acceleration per frame when key is pressed
 
 # Ball settings
-ball_pos = pygame.math.Vector2(WIDTH // 2, HEIGHT // 2)
-ball_velocity = pygame.math.Vector2(3, -2)  # initial velocity (pixels per frame)
+ball_x, ball_y = float(WIDTH // 2), float(HEIGHT // 2)
+ball_vx, ball_vy = 3.0, -2.0  # initial velocity (pixels per frame)
 ball_radius = 15
 GRAVITY = 0.2
 AIR_FRICTION = 0.999  # simulates air resistance
 COEFFICIENT_RESTITUTION = 0.9  # bounciness factor
 
+# The hexagon's inscribed circle has radius equal to its apothem, so a ball whose
+# center is closer than this to the hexagon center cannot touch any edge
+HEXAGON_APOTHEM = HEXAGON_RADIUS * math.cos(math.pi/6)
+CLEAR_OF_WALLS_SQ = (HEXAGON_APOTHEM - ball_radius - 2) ** 2
+
 # Color definitions
 BACKGROUND_COLOR = (20, 20, 30)
 HEXAGON_COLOR = (100, 150, 200)
@@ -30,139 +41,80 @@ BALL_COLOR = (220, 60, 60)
 TEXT_COLOR = (255, 255, 255)
 HIGHLIGHT_COLOR = (255, 200, 0)
 
-def get_hexagon_vertices(center, radius, rotation):
-    """Return a list of six vertices for a regular hexagon rotated by 'rotation'."""
-    vertices = []
+# Trail settings: a segment fades out completely after MAX_TRAIL_LENGTH frames
+MAX_TRAIL_LENGTH = 20
+TRAIL_WIDTH = 5
+TRAIL_COLOR = (*BALL_COLOR, 255)
+TRAIL_FADE_COLOR = (0, 0, 0, 255 // MAX_TRAIL_LENGTH + 1)
+
+# Unrotated hexagon vertices relative to the center as (x, y) pairs.
+# Offset by pi/6 for a flat top appearance
+UNIT_HEX = tuple(
+    (HEXAGON_RADIUS * math.cos(math.pi/6 + i * (math.pi/3)),
+     HEXAGON_RADIUS * math.sin(math.pi/6 + i * (math.pi/3)))
+    for i in range(6)
+)
+HEXAGON_CENTER_XY = (float(HEXAGON_CENTER[0]), float(HEXAGON_CENTER[1]))
+
+def get_hexagon_vertices(center, rotation):
+    """Return the six hexagon vertices rotated by 'rotation' about 'center' as (x, y) pairs."""
+    c, s = math.cos(rotation), math.sin(rotation)
     cx, cy = center
-    # Offset by pi/6 for a flat top appearance
-    for i in range(6):
-        angle = rotation + math.pi/6 + i * (math.pi/3)
-        x = cx + radius * math.cos(angle)
-        y = cy + radius * math.sin(angle)
-        vertices.append(pygame.math.Vector2(x, y))
-    return vertices
-
-def closest_point_on_segment(point, seg_a, seg_b):
-    """Return the closest point on the segment from seg_a to seg_b relative to point."""
-    ap = point - seg_a
-    ab = seg_b - seg_a
-    denom = ab.length_squared()
-    if denom < 0.0001:
-        return pygame.math.Vector2(seg_a)
-    t = ap.dot(ab) / denom
-    t = max(0, min(1, t))
-    return seg_a + ab * t
-
-def wall_velocity_at_point(point, center, angular_velocity):
-    """Compute the tangential (linear) velocity at a point on a rotating body (v = ω × r)."""
-    r = point - pygame.math.Vector2(center)
-    perp = pygame.math.Vector2(-r.y, r.x)
-    return perp * angular_velocity
-
-def handle_collision(ball_pos, ball_velocity, ball_radius, hexagon_vertices, hexagon_center, angular_velocity):
-    """
-    Check and resolve collisions between the ball and each edge of the hexagon.
-    The ball's velocity is adjusted based on the relative motion of the wall.
-    """
-    collision_occurred = False
-    for i in range(len(hexagon_vertices)):
-        p1 = hexagon_vertices[i]
-        p2 = hexagon_vertices[(i + 1) % len(hexagon_vertices)]
-        closest = closest_point_on_segment(ball_pos, p1, p2)
-        dist_vector = ball_pos - closest
-        distance = dist_vector.length()
-        if distance < ball_radius:
-            collision_occurred = True
-            if distance > 0.0001:
-                normal = dist_vector / distance
-            else:
-                edge = p2 - p1
-                edge_length = edge.length()
-                if edge_length > 0.0001:
-                    normal = pygame.math.Vector2(-edge.y / edge_length, edge.x / edge_length)
-                else:
-                    normal = pygame.math.Vector2(0, 1)
-            penetration_depth = ball_radius - distance
-            ball_pos += normal * penetration_depth
-            wall_vel = wall_velocity_at_point(closest, hexagon_center, angular_velocity)
-            rel_vel = ball_velocity - wall_vel
-            if rel_vel.dot(normal) < 0:
-                energy_factor = 1.0 + abs(angular_velocity) * 5
-                bounce_coef = COEFFICIENT_RESTITUTION * energy_factor
-                rel_vel = rel_vel - (1 + bounce_coef) * rel_vel.dot(normal) * normal
-                ball_velocity = rel_vel + wall_vel
-                ball_velocity += pygame.math.Vector2(
-                    (hash(str(ball_pos.x)) % 100) / 2000.0,
-                    (hash(str(ball_pos.y)) % 100) / 2000.0
-                )
-    return ball_pos, ball_velocity, collision_occurred
-
-def point_in_polygon(point, vertices):
+    return tuple((cx + ux * c - uy * s, cy + ux * s + uy * c) for ux, uy in UNIT_HEX)
+
+def step_physics(keys):
     """
-    Check if a point is inside a convex polygon using the winding number algorithm.
+    Advance the hexagon and the ball by one fixed physics step using the held 'keys'.
+    Returns whether the ball bounced off a wall and whether it had to be pushed back inside.
     """
-    winding_number = 0
-    for i in range(len(vertices)):
-        p1 = vertices[i]
-        p2 = vertices[(i + 1) % len(vertices)]
-        if p1.y <= point.y:
-            if p2.y > point.y and (p2 - p1).cross(point - p1) > 0:
-                winding_number += 1
-        else:
-            if p2.y <= point.y and (p2 - p1).cross(point - p1) < 0:
-                winding_number -= 1
-    return winding_number != 0
+    global hexagon_rotation, hexagon_angular_velocity, ball_x, ball_y, ball_vx, ball_vy
+    # Space bar immediately stops the hexagon.
+    if keys[pygame.K_SPACE]:
+        hexagon_angular_velocity = 0.0
+    # Down arrow gradually decreases the spin speed.
+    elif keys[pygame.K_DOWN]:
+        hexagon_angular_velocity *= 0.95
+        if abs(hexagon_angular_velocity) < 0.001:
+            hexagon_angular_velocity = 0.0
+    else:
+        if keys[pygame.K_LEFT]:
+            hexagon_angular_velocity -= ANGULAR_ACCELERATION
+        if keys[pygame.K_RIGHT]:
+            hexagon_angular_velocity += ANGULAR_ACCELERATION
+
+    hexagon_rotation += hexagon_angular_velocity
+
+    ball_vy += GRAVITY
+    ball_vx *= AIR_FRICTION
+    ball_vy *= AIR_FRICTION
+    ball_x += ball_vx
+    ball_y += ball_vy
 
-def ensure_ball_inside(ball_pos, ball_velocity, ball_radius, hex_vertices):
+    # No edge is reachable inside the inscribed circle; see CLEAR_OF_WALLS_SQ
+    dx, dy = ball_x - HEXAGON_CENTER[0], ball_y - HEXAGON_CENTER[1]
+    if dx * dx + dy * dy < CLEAR_OF_WALLS_SQ:
+        return False, False
+
+    hex_vertices = get_hexagon_vertices(HEXAGON_CENTER_XY, hexagon_rotation)
+
+    ball_x, ball_y, ball_vx, ball_vy, collision_happened, containment_collision = resolve_ball(
+        ball_x, ball_y, ball_vx, ball_vy, ball_radius, hex_vertices, HEXAGON_CENTER_XY,
+        hexagon_angular_velocity, COEFFICIENT_RESTITUTION
+    )
+    return collision_happened, containment_collision
+
+def warm_up_physics():
     """
-    If the ball's center is outside the hexagon, reposition it at the boundary
-    and adjust its velocity by reflecting along the inward normal.
+    Run the collision kernel once with the argument types used in play, so a JIT
+    build compiles (or loads from its cache) before the game loop starts. Most
+    physics steps return early inside the inscribed circle, so otherwise that
+    compile would land on the first wall contact, well into play.
     """
-    if point_in_polygon(ball_pos, hex_vertices):
-        return ball_pos, ball_velocity, False
-    min_distance = float('inf')
-    best_closest = None
-    best_normal = None
-    for i in range(len(hex_vertices)):
-        p1 = hex_vertices[i]
-        p2 = hex_vertices[(i + 1) % len(hex_vertices)]
-        closest = closest_point_on_segment(ball_pos, p1, p2)
-        dist_vector = ball_pos - closest
-        distance = dist_vector.length()
-        if distance < min_distance:
-            min_distance = distance
-            if distance > 0.0001:
-                best_normal = dist_vector / distance
-            else:
-                edge = p2 - p1
-                edge_length = edge.length()
-                if edge_length > 0.0001:
-                    best_normal = pygame.math.Vector2(-edge.y / edge_length, edge.x / edge_length)
-                else:
-                    best_normal = pygame.math.Vector2(0, 1)
-            best_closest = closest
-    inward_normal = -best_normal
-    ball_pos = best_closest + inward_normal * ball_radius
-    vel_dot_inward = ball_velocity.dot(inward_normal)
-    if vel_dot_inward < 0:
-        ball_velocity = ball_velocity - (1 + COEFFICIENT_RESTITUTION) * vel_dot_inward * inward_normal
-        return ball_pos, ball_velocity, True
-    return ball_pos, ball_velocity, False
-
-def draw_trail(screen, trail_points, trail_width=2):
-    """Draw a fading trail behind the ball."""
-    if len(trail_points) < 2:
-        return
-    for i in range(1, len(trail_points)):
-        alpha = int(150 * (i / len(trail_points)))
-        color = (BALL_COLOR[0], BALL_COLOR[1], BALL_COLOR[2], alpha)
-        pygame.draw.line(
-            screen, 
-            color, 
-            (trail_points[i-1].x, trail_points[i-1].y),
-            (trail_points[i].x, trail_points[i].y), 
-            max(1, int(trail_width * i / len(trail_points)))
-        )
+    resolve_ball(
+        ball_x, ball_y, ball_vx, ball_vy, ball_radius,
+        get_hexagon_vertices(HEXAGON_CENTER_XY, hexagon_rotation), HEXAGON_CENTER_XY,
+        hexagon_angular_velocity, COEFFICIENT_RESTITUTION
+    )
 
 def format_speed(speed):
     """Format speed values with appropriate precision based on magnitude."""
@@ -173,170 +125,224 @@ def format_speed(speed):
     else:
         return f"{int(speed)}"
 
+# Fonts loaded so far, keyed by point size
+_font_cache = {}
+
+def get_font(size):
+    """Return the shared Arial font of the given size, loading it on first use."""
+    font = _font_cache.get(size)
+    if font is None:
+        font = _font_cache[size] = pygame.font.SysFont("Arial", size)
+    return font
+
+class TextCache:
+    """Memoize rendered text surfaces so unchanged HUD strings are not re-rasterized every frame."""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+
+    def get(self, font, text, color):
+        """Return an antialiased surface for 'text', rendering it only on a cache miss."""
+        key = (id(font), text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
 def main():
-    global hexagon_rotation, ball_pos, ball_velocity, hexagon_angular_velocity
+    global hexagon_rotation, ball_x, ball_y, ball_vx, ball_vy, hexagon_angular_velocity
 
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Bouncing Ball in a Spinning Hexagon")
     clock = pygame.time.Clock()
 
-    # Create a surface for the trail with alpha channel
+    # Persistent alpha layer for the trail; it fades a little every frame
+    # and only the newest segment is drawn onto it. It ends at the position
+    # before the latest physics step, and each render joins it to the
+    # interpolated ball so the tip never runs ahead of the ball.
     trail_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
     
     # Initialize fonts for displaying text
-    font = pygame.font.SysFont("Arial", 24)
-    big_font = pygame.font.SysFont("Arial", 36)
+    font = get_font(24)
+    big_font = get_font(36)
+    text_cache = TextCache()
+
+    # The clickable label at the bottom center never changes or moves
+    clickable_label = font.render("@eizenmanroee", True, TEXT_COLOR)
+    clickable_rect = clickable_label.get_rect(midbottom=(WIDTH // 2, HEIGHT - 10))
 
     # Track metrics
     max_ball_speed = 0.0
+    current_ball_speed = 0.0
     collision_count = 0
-    last_speeds = []
-    speed_history = []
+    last_speeds = deque(maxlen=10)
+    speed_history = deque(maxlen=30)
     
-    # Trail points for ball
-    trail_points = []
-    MAX_TRAIL_LENGTH = 20
+    # Last ball position drawn onto the trail surface
+    last_trail_point = None
     
     # Game state
     game_paused = False
     show_instructions = True
-    instruction_timer = 5 * FPS
+    instruction_timer = 5.0  # seconds the help text stays up, counted from the first frame
     frame_counter = 0
     show_detailed_stats = False
 
     try:
         pygame.mixer.init()
         collision_sound = pygame.mixer.Sound("collision.wav")
-        collision_sound.set_volume(0.3)
+        collision_volume = 0.3
+        collision_sound.set_volume(collision_volume)
     except:
         collision_sound = None
 
+    # Only queue the events the loop handles so mouse motion and other noise
+    # never pile up or have to be dispatched in Python. WINDOWEXPOSED is kept
+    # because every event forces a redraw, which repaints a paused window
+    # after it is uncovered or restored.
+    handled_events = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(handled_events)
+
+    warm_up_physics()
+    # Drop the startup interval (window, fonts, mixer, kernel warm-up) so the
+    # first frame neither runs a backlog of physics steps nor eats the help timer
+    clock.tick()
+
+    # Unprocessed simulation time and the state before the latest physics step,
+    # used to interpolate the rendered frame between the last two steps
+    accumulator = 0.0
+    prev_ball_x, prev_ball_y = ball_x, ball_y
+    prev_rotation = hexagon_rotation
+    needs_redraw = True
+
     running = True
     while running:
-        dt = clock.tick(FPS) / 1000.0
-        frame_counter += 1
+        frame_time = clock.tick(PAUSED_FPS if game_paused else FPS) / 1000.0
 
         # Process events
-        for event in pygame.event.get():
+        for event in pygame.event.get(handled_events):
+            needs_redraw = True
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p:
                     game_paused = not game_paused
+                    # The last tick ran at the other rate; don't feed it to the physics
+                    frame_time = 0.0
                 elif event.key == pygame.K_h:
                     show_instructions = not show_instructions
                 elif event.key == pygame.K_r:
-                    ball_pos = pygame.math.Vector2(WIDTH // 2, HEIGHT // 2)
-                    ball_velocity = pygame.math.Vector2(3, -2)
+                    ball_x, ball_y = float(WIDTH // 2), float(HEIGHT // 2)
+                    ball_vx, ball_vy = 3.0, -2.0
                     hexagon_rotation = 0.0
                     hexagon_angular_velocity = 0.01
                     max_ball_speed = 0.0
                     collision_count = 0
-                    last_speeds = []
-                    speed_history = []
-                    trail_points = []
+                    last_speeds.clear()
+                    speed_history.clear()
+                    last_trail_point = None
+                    trail_surface.fill((0, 0, 0, 0))
+                    prev_ball_x, prev_ball_y = ball_x, ball_y
+                    prev_rotation = hexagon_rotation
                 elif event.key == pygame.K_s:
                     show_detailed_stats = not show_detailed_stats
             # Check for mouse clicks for the clickable label
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # Calculate the clickable label rect for "@eizenmanroee"
-                clickable_text = "@eizenmanroee"
-                text_width, text_height = font.size(clickable_text)
-                clickable_label_rect = pygame.Rect(0, 0, text_width, text_height)
-                clickable_label_rect.midbottom = (WIDTH // 2, HEIGHT - 10)
-                if clickable_label_rect.collidepoint(event.pos):
+                if clickable_rect.collidepoint(event.pos):
                     webbrowser.open("https://x.com/eizenmanroee")
 
+        # Counted in elapsed time, since the loop runs slower while paused
         if instruction_timer > 0:
-            instruction_timer -= 1
-            if instruction_timer == 0:
+            instruction_timer -= frame_time
+            if instruction_timer <= 0:
                 show_instructions = False
+                needs_redraw = True
 
         if not game_paused:
+            needs_redraw = True
+            accumulator += frame_time
             keys = pygame.key.get_pressed()
-            # Space bar immediately stops the hexagon.
-            if keys[pygame.K_SPACE]:
-                hexagon_angular_velocity = 0
-            # Down arrow gradually decreases the spin speed.
-            elif keys[pygame.K_DOWN]:
-                hexagon_angular_velocity *= 0.95
-                if abs(hexagon_angular_velocity) < 0.001:
-                    hexagon_angular_velocity = 0
-            else:
-                if keys[pygame.K_LEFT]:
-                    hexagon_angular_velocity -= ANGULAR_ACCELERATION
-                if keys[pygame.K_RIGHT]:
-                    hexagon_angular_velocity += ANGULAR_ACCELERATION
-
-            hexagon_rotation += hexagon_angular_velocity
-
-            ball_velocity.y += GRAVITY
-            ball_velocity *= AIR_FRICTION
-            ball_pos += ball_velocity
-
-            if len(trail_points) >= MAX_TRAIL_LENGTH:
-                trail_points.pop(0)
-            trail_points.append(pygame.math.Vector2(ball_pos))
-
-            hex_vertices = get_hexagon_vertices(HEXAGON_CENTER, HEXAGON_RADIUS, hexagon_rotation)
-
-            collision_result = handle_collision(ball_pos, ball_velocity, ball_radius, hex_vertices, HEXAGON_CENTER, hexagon_angular_velocity)
-            ball_pos, ball_velocity, collision_happened = collision_result
-            if collision_happened:
-                collision_count += 1
-                if collision_sound:
-                    pitch = min(2.0, max(0.7, ball_velocity.length() / 10))
-                    collision_sound.set_volume(min(1.0, ball_velocity.length() / 20))
-                    collision_sound.play()
-
-            containment_result = ensure_ball_inside(ball_pos, ball_velocity, ball_radius, hex_vertices)
-            ball_pos, ball_velocity, containment_collision = containment_result
-            if containment_collision:
-                collision_count += 1
-
-            current_ball_speed = ball_velocity.length()
-            last_speeds.append(current_ball_speed)
-            if len(last_speeds) > 10:
-                last_speeds.pop(0)
-            if frame_counter % 10 == 0:
-                speed_history.append(current_ball_speed)
-                if len(speed_history) > 30:
-                    speed_history.pop(0)
-            if current_ball_speed > max_ball_speed:
-                max_ball_speed = current_ball_speed
+            steps = 0
+            while accumulator >= PHYSICS_DT and steps < MAX_PHYSICS_STEPS:
+                prev_ball_x, prev_ball_y = ball_x, ball_y
+                prev_rotation = hexagon_rotation
+                collision_happened, containment_collision = step_physics(keys)
+                accumulator -= PHYSICS_DT
+                steps += 1
+                frame_counter += 1
+
+                trail_surface.fill(TRAIL_FADE_COLOR, special_flags=pygame.BLEND_RGBA_SUB)
+                trail_point = (int(prev_ball_x), int(prev_ball_y))
+                if last_trail_point is not None:
+                    pygame.draw.line(trail_surface, TRAIL_COLOR, last_trail_point, trail_point, TRAIL_WIDTH)
+                last_trail_point = trail_point
+
+                current_ball_speed = math.hypot(ball_vx, ball_vy)
+                if collision_happened:
+                    collision_count += 1
+                    if collision_sound:
+                        # Only touch the mixer when the volume changes audibly
+                        volume = min(1.0, current_ball_speed / 20)
+                        if abs(volume - collision_volume) > 0.05:
+                            collision_sound.set_volume(volume)
+                            collision_volume = volume
+                        collision_sound.play()
+                if containment_collision:
+                    collision_count += 1
+
+                last_speeds.append(current_ball_speed)
+                if frame_counter % 10 == 0:
+                    speed_history.append(current_ball_speed)
+                if current_ball_speed > max_ball_speed:
+                    max_ball_speed = current_ball_speed
+            # Drop the backlog the step limit left behind instead of carrying it over
+            if accumulator >= PHYSICS_DT:
+                accumulator %= PHYSICS_DT
+
+        # While paused nothing moves, so only redraw after an input changes the scene
+        if not needs_redraw:
+            continue
+        needs_redraw = False
 
         screen.fill(BACKGROUND_COLOR)
 
-        for i in range(1, len(trail_points)):
-            progress = i / len(trail_points)
-            alpha = int(150 * progress)
-            width = int(1 + 5 * progress)
-            pygame.draw.line(
-                screen,
-                (*BALL_COLOR[:3], alpha),
-                (int(trail_points[i-1].x), int(trail_points[i-1].y)),
-                (int(trail_points[i].x), int(trail_points[i].y)),
-                width
-            )
-
-        hex_points = [(v.x, v.y) for v in hex_vertices]
+        # Render between the last two physics steps by the fraction of a step still pending
+        alpha = accumulator / PHYSICS_DT
+        draw_x = prev_ball_x + (ball_x - prev_ball_x) * alpha
+        draw_y = prev_ball_y + (ball_y - prev_ball_y) * alpha
+        draw_rotation = prev_rotation + (hexagon_rotation - prev_rotation) * alpha
+
+        hex_points = get_hexagon_vertices(HEXAGON_CENTER_XY, draw_rotation)
         pygame.draw.polygon(screen, HEXAGON_COLOR, hex_points)
         pygame.draw.polygon(screen, HEXAGON_OUTLINE_COLOR, hex_points, 3)
 
-        pygame.draw.circle(screen, BALL_COLOR, (int(ball_pos.x), int(ball_pos.y)), ball_radius)
-        highlight_pos = (int(ball_pos.x - ball_radius/3), int(ball_pos.y - ball_radius/3))
-        pygame.draw.circle(screen, (255, 255, 255), highlight_pos, ball_radius//3)
+        ball_ix, ball_iy = int(draw_x), int(draw_y)
+        screen.blit(trail_surface, (0, 0))
+        if last_trail_point is not None:
+            pygame.draw.line(screen, BALL_COLOR, last_trail_point, (ball_ix, ball_iy), TRAIL_WIDTH)
+
+        highlight_size = ball_radius // 3
+        pygame.draw.circle(screen, BALL_COLOR, (ball_ix, ball_iy), ball_radius)
+        highlight_pos = (ball_ix - highlight_size, ball_iy - highlight_size)
+        pygame.draw.circle(screen, (255, 255, 255), highlight_pos, highlight_size)
 
         avg_speed = sum(last_speeds) / max(1, len(last_speeds))
         is_near_max = current_ball_speed > max_ball_speed * 0.9
         
         # Convert hexagon angular speed to linear speed (pixels per frame)
         hex_linear_speed = abs(hexagon_angular_velocity) * HEXAGON_RADIUS
-        hex_speed_text = font.render(f"Hex Speed: {format_speed(hex_linear_speed)}", True, TEXT_COLOR)
-        ball_speed_text = font.render(f"Ball Speed: {format_speed(avg_speed)}", True, 
+        hex_speed_text = text_cache.get(font, f"Hex Speed: {format_speed(hex_linear_speed)}", TEXT_COLOR)
+        ball_speed_text = text_cache.get(font, f"Ball Speed: {format_speed(avg_speed)}", 
                                       HIGHLIGHT_COLOR if is_near_max else TEXT_COLOR)
-        max_speed_text = font.render(f"Max Speed: {format_speed(max_ball_speed)}", True, HIGHLIGHT_COLOR)
+        max_speed_text = text_cache.get(font, f"Max Speed: {format_speed(max_ball_speed)}", HIGHLIGHT_COLOR)
         
         hex_speed_rect = hex_speed_text.get_rect(topright=(WIDTH - 10, 10))
         ball_speed_rect = ball_speed_text.get_rect(topright=(WIDTH - 10, hex_speed_rect.bottom + 5))
@@ -347,15 +353,15 @@ def main():
         screen.blit(max_speed_text, max_speed_rect)
 
         if show_detailed_stats:
-            collision_text = font.render(f"Collisions: {collision_count}", True, TEXT_COLOR)
+            collision_text = text_cache.get(font, f"Collisions: {collision_count}", TEXT_COLOR)
             if speed_history:
                 avg_history = sum(speed_history) / len(speed_history)
                 min_history = min(speed_history)
-                history_text = font.render(f"Avg: {format_speed(avg_history)} | Min: {format_speed(min_history)}", True, TEXT_COLOR)
+                history_text = text_cache.get(font, f"Avg: {format_speed(avg_history)} | Min: {format_speed(min_history)}", TEXT_COLOR)
                 acceleration = 0
                 if len(speed_history) >= 2:
                     acceleration = (speed_history[-1] - speed_history[-2]) / 10 * FPS
-                accel_text = font.render(f"Acceleration: {'+' if acceleration >= 0 else ''}{acceleration:.2f}/s", True, TEXT_COLOR if abs(acceleration) < 1 else HIGHLIGHT_COLOR)
+                accel_text = text_cache.get(font, f"Acceleration: {'+' if acceleration >= 0 else ''}{acceleration:.2f}/s", TEXT_COLOR if abs(acceleration) < 1 else HIGHLIGHT_COLOR)
                 
                 collision_rect = collision_text.get_rect(topleft=(10, 10))
                 history_rect = history_text.get_rect(topleft=(10, collision_rect.bottom + 5))
@@ -368,12 +374,12 @@ def main():
                 collision_rect = collision_text.get_rect(topleft=(10, 10))
                 screen.blit(collision_text, collision_rect)
         else:
-            collision_text = font.render(f"Collisions: {collision_count}", True, TEXT_COLOR)
+            collision_text = text_cache.get(font, f"Collisions: {collision_count}", TEXT_COLOR)
             collision_rect = collision_text.get_rect(topleft=(10, 10))
             screen.blit(collision_text, collision_rect)
 
         if game_paused:
-            pause_text = big_font.render("PAUSED", True, TEXT_COLOR)
+            pause_text = text_cache.get(big_font, "PAUSED", TEXT_COLOR)
             pause_rect = pause_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
             screen.blit(pause_text, pause_rect)
 
@@ -384,14 +390,11 @@ def main():
             ]
             instruction_y = HEIGHT - 10 - (len(instructions) * 30)
             for i, text in enumerate(instructions):
-                instr_text = font.render(text, True, TEXT_COLOR)
+                instr_text = text_cache.get(font, text, TEXT_COLOR)
                 instr_rect = instr_text.get_rect(midbottom=(WIDTH // 2, instruction_y + (i * 30)))
                 screen.blit(instr_text, instr_rect)
 
         # Draw the clickable label at the bottom center
-        clickable_text = "@eizenmanroee"
-        clickable_label = font.render(clickable_text, True, TEXT_COLOR)
-        clickable_rect = clickable_label.get_rect(midbottom=(WIDTH // 2, HEIGHT - 10))
         screen.blit(clickable_label, clickable_rect)
 
         pygame.display.flip()
@@ -0,0 +1,105 @@
+"""
+Numeric collision kernels for the bouncing ball simulation.
+
+These functions are plain scalar loops over the polygon edges, so they stay
+fast as ordinary Python and JIT-compile well with Numba when it is available.
+They can be imported without pygame.
+"""
+import math
+import random
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the collision kernels run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Fast-math without the no-NaN/no-infinity assumptions, since the edge scan
+# starts from math.inf
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+@njit(cache=True, fastmath=FASTMATH)
+def wall_velocity_at_point(px, py, center, angular_velocity):
+    """Compute the tangential (linear) velocity at a point on a rotating body (v = ω × r)."""
+    return -(py - center[1]) * angular_velocity, (px - center[0]) * angular_velocity
+
+@njit(cache=True, fastmath=FASTMATH)
+def resolve_ball(bx, by, vx, vy, radius, verts_xy, center_xy, omega, restitution):
+    """
+    Keep the ball inside the hexagon using a single scan over its edges.
+
+    If the ball's center has left the hexagon it is repositioned at the boundary
+    and reflected along the inward normal. Otherwise, if it penetrates the nearest
+    edge, it is pushed out and bounced off the wall, taking the wall's motion into
+    account. Returns the new position and velocity, whether the ball bounced off a
+    wall and whether it had to be pushed back inside.
+    """
+    # Find the closest point on any edge and whether the center is behind every
+    # edge; edge i runs from vertex i-1 to vertex i
+    n = len(verts_xy)
+    inside = True
+    best_dist2 = math.inf
+    dx = dy = edge_x = edge_y = 0.0
+    ax, ay = verts_xy[n - 1][0], verts_xy[n - 1][1]
+    for i in range(n):
+        px, py = verts_xy[i][0], verts_xy[i][1]
+        abx, aby = px - ax, py - ay
+        apx, apy = bx - ax, by - ay
+        # Positive cross product: the center is on the outer side of this edge
+        if apx * aby - apy * abx > 0:
+            inside = False
+        t = (apx * abx + apy * aby) / (abx * abx + aby * aby)
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+        ox, oy = apx - abx * t, apy - aby * t
+        dist2 = ox * ox + oy * oy
+        if dist2 < best_dist2:
+            best_dist2 = dist2
+            dx, dy = ox, oy
+            edge_x, edge_y = abx, aby
+        ax, ay = px, py
+    distance = math.sqrt(best_dist2)
+    # Inward normal of the nearest edge, used when the center sits exactly on it
+    edge_length = math.hypot(edge_x, edge_y)
+    normal_x, normal_y = -edge_y / edge_length, edge_x / edge_length
+
+    if not inside:
+        if distance > 0.0001:
+            in_x, in_y = -dx / distance, -dy / distance
+        else:
+            in_x, in_y = normal_x, normal_y
+        bx = bx - dx + in_x * radius
+        by = by - dy + in_y * radius
+        vel_dot_inward = vx * in_x + vy * in_y
+        if vel_dot_inward < 0:
+            vx -= (1 + restitution) * vel_dot_inward * in_x
+            vy -= (1 + restitution) * vel_dot_inward * in_y
+            return bx, by, vx, vy, False, True
+        return bx, by, vx, vy, False, False
+
+    if distance >= radius:
+        return bx, by, vx, vy, False, False
+
+    # The center is inside, so the direction from the wall to the ball points inward
+    if distance > 0.0001:
+        in_x, in_y = dx / distance, dy / distance
+    else:
+        in_x, in_y = normal_x, normal_y
+    penetration_depth = radius - distance
+    wall_vx, wall_vy = wall_velocity_at_point(bx - dx, by - dy, center_xy, omega)
+    bx += in_x * penetration_depth
+    by += in_y * penetration_depth
+    rel_vx, rel_vy = vx - wall_vx, vy - wall_vy
+    rel_dot = rel_vx * in_x + rel_vy * in_y
+    if rel_dot < 0:
+        energy_factor = 1.0 + abs(omega) * 5
+        bounce_coef = restitution * energy_factor
+        rel_vx -= (1 + bounce_coef) * rel_dot * in_x
+        rel_vy -= (1 + bounce_coef) * rel_dot * in_y
+        # Small jitter so the ball never settles into a repeating path
+        vx = rel_vx + wall_vx + random.random() * 0.05
+        vy = rel_vy + wall_vy + random.random() * 0.05
+    return bx, by, vx, vy, True, False